@@ -9,9 +9,7 @@ class PayoutCancellationException(PayoutException):
     PayoutCancellationException
     """
 
-    __bitpay_message = "Failed to cancel payout object"
-    __bitpay_code = "BITPAY-PAYOUT-CANCEL"
-    __api_code = ""
+    _PREFIX = "BITPAY-PAYOUT-CANCEL: Failed to cancel payout object:"
 
     def __init__(self, message: str, code: int = 124, api_code: str = "000000"):
         """
@@ -21,6 +19,4 @@ class PayoutCancellationException(PayoutException):
         :param code: [optional] The Exception code to throw.
         :param api_code: [optional] The API Exception code to throw.
         """
-        message = self.__bitpay_code + ": " + self.__bitpay_message + ":" + message
-        self.__api_code = api_code
-        super().__init__(message, code)
+        super().__init__(PayoutCancellationException._PREFIX + message, code, api_code)
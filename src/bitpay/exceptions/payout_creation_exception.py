@@ -9,9 +9,7 @@ class PayoutCreationException(PayoutException):
     PayoutCreationException
     """
 
-    __bitpay_message = "Failed to create payout"
-    __bitpay_code = "BITPAY-PAYOUT-CREATE"
-    __api_code = ""
+    _PREFIX = "BITPAY-PAYOUT-CREATE: Failed to create payout:"
 
     def __init__(self, message: str, code: int = 122, api_code: str = "000000"):
         """
@@ -21,6 +19,4 @@ class PayoutCreationException(PayoutException):
         :param code: [optional] The Exception code to throw.
         :param api_code: [optional] The API Exception code to throw.
         """
-        message = self.__bitpay_code + ": " + self.__bitpay_message + ":" + message
-        self.__api_code = api_code
-        super().__init__(message, code)
+        super().__init__(PayoutCreationException._PREFIX + message, code, api_code)
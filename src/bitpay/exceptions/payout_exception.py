@@ -10,9 +10,10 @@ class PayoutException(BitPayException):
     PayoutException
     """
 
-    __bitpay_message = "An unexpected error occurred while trying to manage the payout"
-    __bitpay_code = "BITPAY-PAYOUT-GENERIC"
-    __api_code = ""
+    _PREFIX = (
+        "BITPAY-PAYOUT-GENERIC: An unexpected error occurred while trying to manage "
+        "the payout:"
+    )
 
     def __init__(self, message: str = "", code: int = 121, api_code: str = "000000"):
         """
@@ -22,6 +23,4 @@ class PayoutException(BitPayException):
         :param code: [optional] The Exception code to throw.
         :param api_code: [optional] The API Exception code to throw.
         """
-        message = self.__bitpay_code + ": " + self.__bitpay_message + ":" + message
-        self.__api_code = api_code
-        super().__init__(message, code)
+        super().__init__(PayoutException._PREFIX + message, code, api_code)
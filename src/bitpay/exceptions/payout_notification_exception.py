@@ -9,9 +9,7 @@ class PayoutNotificationException(PayoutException):
     PayoutNotificationException
     """
 
-    __bitpay_message = "Failed to send payout notification"
-    __bitpay_code = "BITPAY-PAYOUT-NOTIFICATION"
-    __api_code = ""
+    _PREFIX = "BITPAY-PAYOUT-NOTIFICATION: Failed to send payout notification:"
 
     def __init__(self, message: str, code: int = 126, api_code: str = "000000"):
         """
@@ -21,6 +19,4 @@ class PayoutNotificationException(PayoutException):
         :param code: [optional] The Exception code to throw.
         :param api_code: [optional] The API Exception code to throw.
         """
-        message = self.__bitpay_code + ": " + self.__bitpay_message + ":" + message
-        self.__api_code = api_code
-        super().__init__(message, code)
+        super().__init__(PayoutNotificationException._PREFIX + message, code, api_code)
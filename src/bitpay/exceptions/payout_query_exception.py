@@ -9,9 +9,7 @@ class PayoutQueryException(PayoutException):
     PayoutQueryException
     """
 
-    __bitpay_message = "Failed to retrieve payout"
-    __bitpay_code = "BITPAY-PAYOUT-GET"
-    __api_code = ""
+    _PREFIX = "BITPAY-PAYOUT-GET: Failed to retrieve payout:"
 
     def __init__(self, message: str, code: int = 123, api_code: str = "000000"):
         """
@@ -21,6 +19,4 @@ class PayoutQueryException(PayoutException):
         :param code: [optional] The Exception code to throw.
         :param api_code: [optional] The API Exception code to throw.
         """
-        message = self.__bitpay_code + ": " + self.__bitpay_message + ":" + message
-        self.__api_code = api_code
-        super().__init__(message, code)
+        super().__init__(PayoutQueryException._PREFIX + message, code, api_code)
@@ -17,14 +17,17 @@ class BitPayModel(BaseModel):
         """
         :return: data in json
         """
+        if not self.model_fields_set:
+            return {}
         return self.model_dump(exclude_unset=True, by_alias=True)
 
     @field_validator("currency", check_fields=False)
     def validate_currency(cls, currency_code: Union[str, None]) -> Union[str, None]:
-        from bitpay.models.currency import Currency
-
         if currency_code is None:
             return currency_code
+
+        from bitpay.models.currency import Currency
+
         currency_code = currency_code.upper()
         if Currency.is_valid(currency_code) is False:
             raise BitPayException("currency code must be a type of Model.Currency")
@@ -1,4 +1,5 @@
 # mypy: disable-error-code="misc, union-attr, assignment, arg-type"
+from functools import lru_cache
 from typing import Any
 
 from bitpay.exceptions.bitpay_exception import BitPayException
@@ -32,6 +33,7 @@ class ModelUtil:
         return result
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def convert_snake_case_fields_to_camel_case(key: str) -> str:
         words = key.split("_")
         key = words[0] + "".join(word[:1].upper() + word[1:] for word in words[1:])
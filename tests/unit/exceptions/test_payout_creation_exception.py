@@ -0,0 +1,16 @@
+import pytest
+
+from bitpay.exceptions.payout_creation_exception import PayoutCreationException
+
+
+@pytest.mark.unit
+def test_constructor():
+    exception = PayoutCreationException("some error", api_code="010207")
+
+    assert (
+        exception.args[0] == "BITPAY-GENERIC: Unexpected Bitpay exception.:"
+        "BITPAY-PAYOUT-GENERIC: An unexpected error occurred while trying to manage the payout:"
+        "BITPAY-PAYOUT-CREATE: Failed to create payout:some error"
+    )
+    assert 122 == exception.args[1]
+    assert "010207" == exception.get_api_code()
@@ -12,3 +12,17 @@ def test_construct():
 
     assert support_request == refund.support_request
     assert currency == refund.currency
+
+
+@pytest.mark.unit
+def test_to_json_without_fields():
+    refund = RefundInfo()
+
+    assert {} == refund.to_json()
+
+
+@pytest.mark.unit
+def test_to_json_keeps_fields_explicitly_set_to_none():
+    refund = RefundInfo(currency=None)
+
+    assert {"currency": None} == refund.to_json()
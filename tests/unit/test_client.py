@@ -19,54 +19,96 @@ from bitpay.models.payout.payout_recipients import PayoutRecipients
 from bitpay.utils.guid_generator import GuidGenerator
 from bitpay.utils.token_container import TokenContainer
 
+pytestmark = pytest.mark.unit
+
 guid_token = "chc9kj52-04g0-4b6f-941d-3a844e352758"
 merchant_token_value = "someMerchantToken"
 payout_token_value = "somePayoutToken"
 pos_token_value = "somePosToken"
 invoice_id = "UZjwcYkWAKfTMn9J1yyfs4"
 
+_TOKEN_MAP = {
+    Facade.MERCHANT: merchant_token_value,
+    Facade.PAYOUT: payout_token_value,
+    Facade.POS: pos_token_value,
+}
+
+_FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "json")
+
+
+def _load_fixtures():
+    fixtures = {}
+    with os.scandir(_FIXTURE_DIR) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json"):
+                with open(entry.path, "rb") as file:
+                    fixtures[entry.name] = json.loads(file.read())
+
+    return fixtures
+
+
+# parsed once at import; tests only read these, never mutate them
+_FIXTURES = _load_fixtures()
+
 
-def get_bitpay_client(mocker):
+def load_fixture(name):
+    return _FIXTURES[name]
+
+
+@pytest.fixture
+def bitpay_client(mocker):
     return mocker.Mock(spec=BitPayClient)
 
 
-def get_token_container(mocker):
+@pytest.fixture
+def token_container(mocker):
     token_container = mocker.Mock(spec=TokenContainer)
-    token_container.get_access_token.side_effect = lambda value: {
-        Facade.MERCHANT: merchant_token_value,
-        Facade.PAYOUT: payout_token_value,
-    }.get(value)
+    token_container.get_access_token.side_effect = _TOKEN_MAP.get
 
     return token_container
 
 
-def get_guid_generator(mocker):
+@pytest.fixture
+def guid_generator(mocker):
     generator = mocker.Mock(spec=GuidGenerator)
     generator.execute.return_value = guid_token
 
     return generator
 
 
-def init_client(mocker, bitpay_client) -> Client:
-    return Client(
-        bitpay_client, get_token_container(mocker), get_guid_generator(mocker)
-    )
+@pytest.fixture
+def client(bitpay_client, token_container, guid_generator) -> Client:
+    return Client(bitpay_client, token_container, guid_generator)
 
 
-def mock_response(
-    mocked_response, mocked_endpoint, mocked_data, mocked_sign_request=None
-):
-    return (
-        lambda endpoint, json_response, sign_request=None: mocked_response
-        if (endpoint, json_response, sign_request)
-        == (mocked_endpoint, mocked_data, mocked_sign_request)
-        else (
-            mocked_response
-            if sign_request is None
-            and (endpoint, json_response) == (mocked_endpoint, mocked_data)
-            else Exception("Invalid request")
+class MockResponse:
+    """
+    side_effect for BitPayClient mocks: returns the mocked response when
+    called with the expected endpoint, data and sign_request.
+    """
+
+    __slots__ = ("response", "endpoint", "data", "sign_request")
+
+    def __init__(self, response, endpoint, data, sign_request=None):
+        self.response = response
+        self.endpoint = endpoint
+        self.data = data
+        self.sign_request = sign_request
+
+    def __call__(self, endpoint, json_response, sign_request=None):
+        # clients that rely on BitPayClient's default sign_request omit it
+        if (
+            endpoint == self.endpoint
+            and json_response == self.data
+            and (sign_request is None or sign_request == self.sign_request)
+        ):
+            return self.response
+        raise AssertionError(
+            "Invalid request: %s %s %s" % (endpoint, json_response, sign_request)
         )
-    )
+
+
+mock_response = MockResponse
 
 
 def get_example_invoice():
@@ -144,18 +186,50 @@ def get_example_payout():
     return payout
 
 
-@pytest.mark.unit
-def test_get_currencies(mocker):
+@pytest.fixture(scope="session")
+def example_invoice_template():
+    return get_example_invoice()
+
+
+@pytest.fixture
+def example_invoice(example_invoice_template):
+    return example_invoice_template.model_copy(deep=True)
+
+
+@pytest.fixture(scope="session")
+def example_bill_template():
+    return get_example_bill()
+
+
+@pytest.fixture
+def example_bill(example_bill_template):
+    return example_bill_template.model_copy(deep=True)
+
+
+@pytest.fixture(scope="session")
+def example_payout_recipients_template():
+    return get_example_payout_recipients()
+
+
+@pytest.fixture
+def example_payout_recipients(example_payout_recipients_template):
+    return example_payout_recipients_template.model_copy(deep=True)
+
+
+@pytest.fixture(scope="session")
+def example_payout_template():
+    return get_example_payout()
+
+
+@pytest.fixture
+def example_payout(example_payout_template):
+    return example_payout_template.model_copy(deep=True)
+
+
+def test_get_currencies(bitpay_client, client):
     # arrange
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/get_currencies_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_currencies_response.json")
     bitpay_client.get.side_effect = mock_response(response, "currencies", None, False)
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.get_currencies()
@@ -166,30 +240,31 @@ def test_get_currencies(mocker):
     assert result.get("BTC").name == "Bitcoin"
 
 
-@pytest.mark.unit
-def test_create_invoice_by_merchant(mocker):
+@pytest.mark.parametrize(
+    "sign_request,request_file,call_kwargs",
+    [
+        (True, "create_invoice_request.json", {}),
+        (
+            False,
+            "create_invoice_by_pos_request.json",
+            {"facade": Facade.POS, "sign_request": False},
+        ),
+    ],
+    ids=["merchant", "pos"],
+)
+def test_create_invoice(
+    bitpay_client, client, example_invoice, sign_request, request_file, call_kwargs
+):
     # arrange
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/create_invoice_request.json",
-        "r",
-    ) as file:
-        invoice_dict = json.load(file)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/create_invoice_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    request = load_fixture(request_file)
+    response = load_fixture("create_invoice_response.json")
 
     bitpay_client.post.side_effect = mock_response(
-        response, "invoices", invoice_dict, True
+        response, "invoices", request, sign_request
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
-    result = client.create_invoice(get_example_invoice(), Facade.MERCHANT, True)
+    result = client.create_invoice(example_invoice, **call_kwargs)
 
     # assert
     assert result.order_id == "026184kc-d001-41j9-9732d-bb249u7b0c24"
@@ -213,59 +288,24 @@ def test_create_invoice_by_merchant(mocker):
     )
 
 
-@pytest.mark.unit
-def test_create_invoice_by_pos(mocker):
+@pytest.mark.parametrize(
+    "token,sign_request,call_kwargs",
+    [
+        (merchant_token_value, True, {}),
+        (pos_token_value, False, {"facade": Facade.POS, "sign_request": False}),
+    ],
+    ids=["merchant", "pos"],
+)
+def test_get_invoice(bitpay_client, client, token, sign_request, call_kwargs):
     # arrange
-    token_container = mocker.Mock(spec=TokenContainer)
-    token_container.get_access_token.side_effect = lambda value: {
-        Facade.POS: pos_token_value,
-    }.get(value)
-
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/create_invoice_by_pos_request.json",
-        "r",
-    ) as file:
-        request = json.load(file)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/create_invoice_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
-
-    bitpay_client.post.side_effect = mock_response(response, "invoices", request, False)
-    client = Client(bitpay_client, token_container, get_guid_generator(mocker))
-
-    # act
-    result = client.create_invoice(get_example_invoice(), Facade.POS, False)
-
-    # assert
-    assert result.order_id == "026184kc-d001-41j9-9732d-bb249u7b0c24"
-    assert result.guid == "chc9kj52-04g0-4b6f-941d-3a844e352758"
-    assert result.buyer_provided_info.name == "Marcin"
-    assert result.payment_totals["ETH"] == 9589000000000000
-    assert result.merchant_name == "SUMO Heavy Industries LLC"
-
-
-@pytest.mark.unit
-def test_get_invoice_by_merchant(mocker):
-    # arrange
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/get_invoice_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_invoice_response.json")
 
     bitpay_client.get.side_effect = mock_response(
-        response, "invoices/" + invoice_id, {"token": merchant_token_value}, True
+        response, "invoices/" + invoice_id, {"token": token}, sign_request
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
-    result = client.get_invoice(invoice_id, Facade.MERCHANT)
+    result = client.get_invoice(invoice_id, **call_kwargs)
 
     # assert
     assert result.guid == guid_token
@@ -274,49 +314,13 @@ def test_get_invoice_by_merchant(mocker):
     assert result.merchant_name == "SUMO Heavy Industries LLC"
 
 
-@pytest.mark.unit
-def test_get_invoice_by_pos(mocker):
+def test_get_invoice_by_guid(bitpay_client, client):
     # arrange
-    token_container = mocker.Mock(spec=TokenContainer)
-    token_container.get_access_token.side_effect = lambda value: {
-        Facade.POS: pos_token_value,
-    }.get(value)
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/get_invoice_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
-
-    bitpay_client.get.side_effect = mock_response(
-        response, "invoices/" + invoice_id, {"token": pos_token_value}, False
-    )
-    client = Client(bitpay_client, token_container, get_guid_generator(mocker))
-
-    # act
-    result = client.get_invoice(invoice_id, Facade.POS, False)
-
-    # assert
-    assert result.guid == guid_token
-    assert result.order_id == "084a86b6-68aa-47bc-b435-e64d122391d1"
-    assert result.buyer_provided_info.name == "Marcin"
-    assert result.merchant_name == "SUMO Heavy Industries LLC"
-
-
-@pytest.mark.unit
-def test_get_invoice_by_guid(mocker):
-    # arrange
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/get_invoice_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_invoice_response.json")
 
     bitpay_client.get.side_effect = mock_response(
         response, "invoices/guid/" + guid_token, {"token": merchant_token_value}, True
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.get_invoice_by_guid(guid_token, Facade.MERCHANT)
@@ -328,15 +332,9 @@ def test_get_invoice_by_guid(mocker):
     assert result.merchant_name == "SUMO Heavy Industries LLC"
 
 
-@pytest.mark.unit
-def test_get_invoices(mocker):
+def test_get_invoices(bitpay_client, client):
     # arrange
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/get_invoices_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_invoices_response.json")
     date_start = "2022-5-10"
     date_end = "2022-5-11"
     status = "complete"
@@ -354,7 +352,6 @@ def test_get_invoices(mocker):
         },
         True,
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.get_invoices(date_start, date_end, status, None, limit, None)
@@ -366,16 +363,9 @@ def test_get_invoices(mocker):
     assert result[0].merchant_name == "SUMO Heavy Industries LLC"
 
 
-@pytest.mark.unit
-def test_get_invoice_event_token(mocker):
+def test_get_invoice_event_token(bitpay_client, client):
     # arrange
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/get_invoice_event_token.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_invoice_event_token.json")
 
     bitpay_client.get.side_effect = mock_response(
         response,
@@ -383,7 +373,6 @@ def test_get_invoice_event_token(mocker):
         {"token": merchant_token_value},
         True,
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.get_invoice_event_token(invoice_id)
@@ -397,24 +386,17 @@ def test_get_invoice_event_token(mocker):
     assert result.actions[1] == "unsubscribe"
 
 
-@pytest.mark.unit
-def test_update_invoice(mocker):
+def test_update_invoice(bitpay_client, client):
     # arrange
     invoice_id = "12345"
     buyer_email = "some@email.com"
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/get_invoice_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_invoice_response.json")
 
     bitpay_client.update.side_effect = mock_response(
         response,
         "invoices/" + invoice_id,
         {"token": merchant_token_value, "buyerEmail": buyer_email},
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.update_invoice(invoice_id, buyer_email)
@@ -423,21 +405,14 @@ def test_update_invoice(mocker):
     assert result.guid == "chc9kj52-04g0-4b6f-941d-3a844e352758"
 
 
-@pytest.mark.unit
-def test_pay_invoice(mocker):
+def test_pay_invoice(bitpay_client, client):
     # arrange
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/pay_invoice_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("pay_invoice_response.json")
     params = {"token": merchant_token_value, "status": "complete"}
 
     bitpay_client.update.side_effect = mock_response(
         response, "invoices/pay/" + invoice_id, params, True
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.pay_invoice(invoice_id, "complete")
@@ -448,70 +423,31 @@ def test_pay_invoice(mocker):
     assert result.transactions[1].ex_rates is None
 
 
-@pytest.mark.unit
-def test_forced_cancel_invoice(mocker):
+@pytest.mark.parametrize("force_cancel", [True, False], ids=["forced", "not_forced"])
+def test_cancel_invoice(bitpay_client, client, force_cancel):
     # arrange
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/cancel_invoice_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
-    params = {"token": merchant_token_value, "forceCancel": True}
+    response = load_fixture("cancel_invoice_response.json")
+    params = {"token": merchant_token_value, "forceCancel": force_cancel}
     bitpay_client.delete.side_effect = mock_response(
         response, "invoices/" + invoice_id, params, True
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
-    result = client.cancel_invoice(invoice_id, True)
+    result = client.cancel_invoice(invoice_id, force_cancel)
 
     # assert
     assert result.guid == "payment#1234"
     assert result.is_cancelled is True
 
 
-@pytest.mark.unit
-def test_cancel_invoice(mocker):
-    # arrange
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/cancel_invoice_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
-    params = {"token": merchant_token_value, "forceCancel": False}
-    bitpay_client.delete.side_effect = mock_response(
-        response, "invoices/" + invoice_id, params, True
-    )
-    client = init_client(mocker, bitpay_client)
-
-    # act
-    result = client.cancel_invoice(invoice_id, False)
-
-    # assert
-    assert result.guid == "payment#1234"
-    assert result.is_cancelled is True
-
-
-@pytest.mark.unit
-def test_cancel_invoice_by_guid(mocker):
+def test_cancel_invoice_by_guid(bitpay_client, client):
     # arrange
     guid = "12345"
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/cancel_invoice_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("cancel_invoice_response.json")
     params = {"token": merchant_token_value, "forceCancel": False}
     bitpay_client.delete.side_effect = mock_response(
         response, "invoices/guid/" + guid, params, True
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.cancel_invoice_by_guid(guid, False)
@@ -521,34 +457,9 @@ def test_cancel_invoice_by_guid(mocker):
     assert result.is_cancelled
 
 
-@pytest.mark.unit
-def test_request_invoice_notifications(mocker):
-    # arrange
-    bitpay_client = get_bitpay_client(mocker)
-    response = "success"
-    params = {"token": merchant_token_value}
-    bitpay_client.post.side_effect = mock_response(
-        response, "invoices/" + invoice_id + "/notifications", params, True
-    )
-    client = init_client(mocker, bitpay_client)
-
-    # act
-    result = client.request_invoice_notifications(invoice_id)
-
-    # assert
-    assert result is True
-
-
-@pytest.mark.unit
-def test_create_refund(mocker):
+def test_create_refund(bitpay_client, client):
     # arrange
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/create_refund_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("create_refund_response.json")
     guid = "37bd36bd-6fcb-409c-a907-47f9244302aa"
     params = {
         "token": merchant_token_value,
@@ -561,7 +472,6 @@ def test_create_refund(mocker):
         "buyerPaysRefundFee": False,
     }
     bitpay_client.post.side_effect = mock_response(response, "refunds", params, True)
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.create_refund(
@@ -576,21 +486,14 @@ def test_create_refund(mocker):
     assert result.buyer_pays_refund_fee is False
 
 
-@pytest.mark.unit
-def test_get_refund_by_id(mocker):
+def test_get_refund_by_id(bitpay_client, client):
     # arrange
     refund_id = "WoE46gSLkJQS48RJEiNw3L"
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/get_refund_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_refund_response.json")
     params = {"token": merchant_token_value}
     bitpay_client.get.side_effect = mock_response(
         response, "refunds/" + refund_id, params, True
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.get_refund(refund_id)
@@ -602,21 +505,14 @@ def test_get_refund_by_id(mocker):
     assert result.buyer_pays_refund_fee is False
 
 
-@pytest.mark.unit
-def test_get_refund_by_guid(mocker):
+def test_get_refund_by_guid(bitpay_client, client):
     # arrange
     guid = "37bd36bd-6fcb-409c-a907-47f9244302aa"
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/get_refund_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_refund_response.json")
     params = {"token": merchant_token_value}
     bitpay_client.get.side_effect = mock_response(
         response, "refunds/guid/" + guid, params, True
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.get_refund_by_guid(guid)
@@ -628,19 +524,12 @@ def test_get_refund_by_guid(mocker):
     assert result.buyer_pays_refund_fee is False
 
 
-@pytest.mark.unit
-def test_get_refunds(mocker):
+def test_get_refunds(bitpay_client, client):
     # arrange
     invoice_id = "Hpqc63wvE1ZjzeeH4kEycF"
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/get_refunds_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_refunds_response.json")
     params = {"token": merchant_token_value, "invoiceId": invoice_id}
     bitpay_client.get.side_effect = mock_response(response, "refunds", params, True)
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.get_refunds(invoice_id)
@@ -651,22 +540,15 @@ def test_get_refunds(mocker):
     assert result[0].reference == "Test refund"
 
 
-@pytest.mark.unit
-def update_refund_by_id(mocker):
+def update_refund_by_id(bitpay_client, client):
     # arrange
     refund_id = "WoE46gSLkJQS48RJEiNw3L"
     status = "complete"
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/get_refund_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_refund_response.json")
     params = {"token": merchant_token_value, "status": status}
     bitpay_client.update.side_effect = mock_response(
         response, "refunds" + refund_id, params, True
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.update_refund(refund_id, status)
@@ -678,22 +560,15 @@ def update_refund_by_id(mocker):
     assert result.buyer_pays_refund_fee is False
 
 
-@pytest.mark.unit
-def update_refund_by_guid(mocker):
+def update_refund_by_guid(bitpay_client, client):
     # arrange
     guid_id = "37bd36bd-6fcb-409c-a907-47f9244302aa"
     status = "complete"
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/get_refund_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_refund_response.json")
     params = {"token": merchant_token_value, "status": status}
     bitpay_client.update.side_effect = mock_response(
         response, "refunds" + guid_id, params, True
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.update_refund_by_guid(guid_id, status)
@@ -705,41 +580,14 @@ def update_refund_by_guid(mocker):
     assert result.buyer_pays_refund_fee is False
 
 
-@pytest.mark.unit
-def test_send_refund_notification(mocker):
-    # arrange
-    refund_id = "1234"
-    bitpay_client = get_bitpay_client(mocker)
-    response = {"status": "success"}
-    params = {"token": merchant_token_value}
-    bitpay_client.post.side_effect = mock_response(
-        response, "refunds/" + refund_id + "/notifications", params, True
-    )
-    client = init_client(mocker, bitpay_client)
-
-    # act
-    result = client.request_refund_notification(refund_id)
-
-    # assert
-    assert result is True
-
-
-@pytest.mark.unit
-def test_cancel_refund_by_id(mocker):
+def test_cancel_refund_by_id(bitpay_client, client):
     # arrange
     refund_id = "WoE46gSLkJQS48RJEiNw3L"
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/cancel_refund_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("cancel_refund_response.json")
     params = {"token": merchant_token_value}
     bitpay_client.delete.side_effect = mock_response(
         response, "refunds/" + refund_id, params, True
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.cancel_refund(refund_id)
@@ -748,22 +596,14 @@ def test_cancel_refund_by_id(mocker):
     assert result.status == "cancelled"
 
 
-@pytest.mark.unit
-def test_cancel_refund_by_guid(mocker):
+def test_cancel_refund_by_guid(bitpay_client, client):
     # arrange
     guid = "12345"
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/cancel_refund_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("cancel_refund_response.json")
     params = {"token": merchant_token_value}
     bitpay_client.delete.side_effect = mock_response(
         response, "refunds/guid/" + guid, params, True
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.cancel_refund_by_guid(guid)
@@ -772,66 +612,30 @@ def test_cancel_refund_by_guid(mocker):
     assert result.status == "cancelled"
 
 
-@pytest.mark.unit
-def test_create_bill_by_merchant_facade(mocker):
+@pytest.mark.parametrize(
+    "sign_request,request_file,call_kwargs",
+    [
+        (True, "create_bill_request.json", {}),
+        (
+            False,
+            "create_bill_by_pos_request.json",
+            {"facade": Facade.POS, "sign_request": False},
+        ),
+    ],
+    ids=["merchant", "pos"],
+)
+def test_create_bill(
+    bitpay_client, client, example_bill, sign_request, request_file, call_kwargs
+):
     # arrange
-    bill = get_example_bill()
-
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/create_bill_request.json",
-        "r",
-    ) as file:
-        request = json.load(file)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/create_bill_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
-    bitpay_client.post.side_effect = mock_response(response, "bills", request, True)
-    client = init_client(mocker, bitpay_client)
-
-    # act
-    result = client.create_bill(bill)
-
-    # assert
-    assert result.status == "draft"
-    assert result.number == "bill1234-ABCD"
-    assert result.cc[0] == "jane@doe.com"
-    assert result.id == "X6KJbe9RxAGWNReCwd1xRw"
-    assert result.items[1].description == "Test Item 2"
-    assert (
-        result.token
-        == "qVVgRARN6fKtNZ7Tcq6qpoPBBE3NxdrmdMD883RyMK4Pf8EHENKVxCXhRwyynWveo"
+    request = load_fixture(request_file)
+    response = load_fixture("create_bill_response.json")
+    bitpay_client.post.side_effect = mock_response(
+        response, "bills", request, sign_request
     )
 
-
-@pytest.mark.unit
-def test_create_bill_by_pos_facade(mocker):
-    # arrange
-    token_container = mocker.Mock(spec=TokenContainer)
-    token_container.get_access_token.side_effect = lambda value: {
-        Facade.POS: pos_token_value,
-    }.get(value)
-    bill = get_example_bill()
-
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/create_bill_by_pos_request.json",
-        "r",
-    ) as file:
-        request = json.load(file)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/create_bill_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
-    bitpay_client.post.side_effect = mock_response(response, "bills", request, False)
-    client = Client(bitpay_client, token_container, get_guid_generator(mocker))
-
     # act
-    result = client.create_bill(bill, Facade.POS, False)
+    result = client.create_bill(example_bill, **call_kwargs)
 
     # assert
     assert result.status == "draft"
@@ -845,23 +649,25 @@ def test_create_bill_by_pos_facade(mocker):
     )
 
 
-@pytest.mark.unit
-def test_get_bill_by_merchant_facade(mocker):
+@pytest.mark.parametrize(
+    "token,sign_request,call_kwargs",
+    [
+        (merchant_token_value, True, {}),
+        (pos_token_value, False, {"facade": Facade.POS, "sign_request": False}),
+    ],
+    ids=["merchant", "pos"],
+)
+def test_get_bill(bitpay_client, client, token, sign_request, call_kwargs):
     # arrange
     bill_id = "X6KJbe9RxAGWNReCwd1xRw"
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/get_bill_response.json", "r"
-    ) as file:
-        response = json.load(file)
-    params = {"token": merchant_token_value}
+    response = load_fixture("get_bill_response.json")
+    params = {"token": token}
     bitpay_client.get.side_effect = mock_response(
-        response, "bills/" + bill_id, params, True
+        response, "bills/" + bill_id, params, sign_request
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
-    result = client.get_bill(bill_id)
+    result = client.get_bill(bill_id, **call_kwargs)
 
     # assert
     assert result.status == "draft"
@@ -874,82 +680,16 @@ def test_get_bill_by_merchant_facade(mocker):
     )
 
 
-@pytest.mark.unit
-def test_get_bill_by_pos_facade(mocker):
+@pytest.mark.parametrize(
+    "status,extra_params",
+    [(None, {}), ("draft", {"status": "draft"})],
+    ids=["all", "by_status"],
+)
+def test_get_bills(bitpay_client, client, status, extra_params):
     # arrange
-    token_container = mocker.Mock(spec=TokenContainer)
-    token_container.get_access_token.side_effect = lambda value: {
-        Facade.POS: pos_token_value,
-    }.get(value)
-    bill_id = "X6KJbe9RxAGWNReCwd1xRw"
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/get_bill_response.json", "r"
-    ) as file:
-        response = json.load(file)
-    params = {"token": pos_token_value}
-    bitpay_client.get.side_effect = mock_response(
-        response, "bills/" + bill_id, params, False
-    )
-    client = Client(bitpay_client, token_container, get_guid_generator(mocker))
-
-    # act
-    result = client.get_bill(bill_id, Facade.POS, False)
-
-    # assert
-    assert result.status == "draft"
-    assert result.merchant == "7HyKWn3d4xdhAMQYAEVxVq"
-    assert result.items[1].id == "Apy3i2TpzHRYP8tJCkrZMT"
-    assert (
-        result.token
-        == "6EBQR37MgDJPfEiLY3jtRq7eTP2aodR5V5wmXyyZhru5FM5yF4RCGKYQtnT7nhwHjA"
-    )
-
-
-@pytest.mark.unit
-def test_get_bills(mocker):
-    # arrange
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/get_bills_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
-    params = {"token": merchant_token_value}
-    bitpay_client.get.side_effect = mock_response(response, "bills", params, True)
-    client = init_client(mocker, bitpay_client)
-
-    # act
-    result = client.get_bills()
-
-    # assert
-    assert len(result) == 2
-    assert (
-        result[0].token
-        == "6EBQR37MgDJPfEiLY3jtRqBMYLg8XSDqhp2kp7VSDqCMHGHnsw4bqnnwQmtehzCvSo"
-    )
-    assert (
-        result[1].token
-        == "6EBQR37MgDJPfEiLY3jtRq7eTP2aodR5V5wmXyyZhru5FM5yF4RCGKYQtnT7nhwHjA"
-    )
-    assert result[0].id == "X6KJbe9RxAGWNReCwd1xRw"
-    assert result[1].id == "3Zpmji8bRKxWJo2NJbWX5H"
-    assert result[1].state == "VA"
-
-
-@pytest.mark.unit
-def test_get_bills_by_status(mocker):
-    # arrange
-    status = "draft"
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/get_bills_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
-    params = {"token": merchant_token_value, "status": status}
+    response = load_fixture("get_bills_response.json")
+    params = {"token": merchant_token_value, **extra_params}
     bitpay_client.get.side_effect = mock_response(response, "bills", params, True)
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.get_bills(status)
@@ -969,41 +709,27 @@ def test_get_bills_by_status(mocker):
     assert result[1].state == "VA"
 
 
-@pytest.mark.unit
-def test_update_bill_with_missing_token_should_throws_exception(mocker):
+def test_update_bill_with_missing_token_should_throws_exception(client, example_bill):
     with pytest.raises(BillUpdateException):
         # arrange
         bill_id = "1234"
-        bitpay_client = get_bitpay_client(mocker)
-        client = init_client(mocker, bitpay_client)
 
         # act
-        client.update_bill(get_example_bill(), bill_id)
+        client.update_bill(example_bill, bill_id)
 
 
-@pytest.mark.unit
-def test_update_bill(mocker):
+def test_update_bill(bitpay_client, client, example_bill):
     # arrange
     bill_id = "1234"
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/update_bill_request.json",
-        "r",
-    ) as file:
-        request = json.load(file)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/get_bill_response.json", "r"
-    ) as file:
-        response = json.load(file)
+    request = load_fixture("update_bill_request.json")
+    response = load_fixture("get_bill_response.json")
     bitpay_client.update.side_effect = mock_response(
         response, "bills/" + bill_id, request, True
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
-    bill = get_example_bill()
-    bill.token = "billToken"
-    result = client.update_bill(bill, bill_id)
+    example_bill.token = "billToken"
+    result = client.update_bill(example_bill, bill_id)
 
     # assert
     assert result.status == "draft"
@@ -1017,36 +743,10 @@ def test_update_bill(mocker):
     )
 
 
-@pytest.mark.unit
-def test_deliver_bill_by_merchant_facade(mocker):
+def test_get_rates(bitpay_client, client):
     # arrange
-    bill_id = "12345"
-    bill_token = "someBillToken"
-    bitpay_client = get_bitpay_client(mocker)
-    params = {"token": bill_token}
-    bitpay_client.post.side_effect = mock_response(
-        "Success", "bills/" + bill_id + "/deliveries", params, True
-    )
-    client = init_client(mocker, bitpay_client)
-
-    # act
-    result = client.deliver_bill(bill_id, bill_token)
-
-    # assert
-    assert result is True
-
-
-@pytest.mark.unit
-def test_get_rates(mocker):
-    # arrange
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/get_rates_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_rates_response.json")
     bitpay_client.get.side_effect = mock_response(response, "rates", None, False)
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.get_rates()
@@ -1056,50 +756,33 @@ def test_get_rates(mocker):
     assert result.get_rate("BCH") == 50.77
 
 
-@pytest.mark.unit
-def test_get_currency_rates_usd(mocker):
-    # arrange
-    bitpay_client = get_bitpay_client(mocker)
-    response = {"code": "USD", "name": "US Dollar", "rate": 27430}
-    bitpay_client.get.side_effect = mock_response(response, "rates/USD", None, False)
-    client = init_client(mocker, bitpay_client)
-
-    # act
-    result = client.get_currency_rates("USD")
-
-    # assert
-    assert len(result.rates) == 1
-
-
-@pytest.mark.unit
-def test_get_currency_rates_btc(mocker):
+@pytest.mark.parametrize(
+    "currency,response,expected_count",
+    [
+        ("USD", {"code": "USD", "name": "US Dollar", "rate": 27430}, 1),
+        ("BCH", load_fixture("get_rates_bch_response.json"), 183),
+    ],
+    ids=["usd", "bch"],
+)
+def test_get_currency_rates(bitpay_client, client, currency, response, expected_count):
     # arrange
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/get_rates_bch_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
-    bitpay_client.get.side_effect = mock_response(response, "rates/BCH", None, False)
-    client = init_client(mocker, bitpay_client)
+    bitpay_client.get.side_effect = mock_response(
+        response, "rates/" + currency, None, False
+    )
 
     # act
-    result = client.get_currency_rates("BCH")
+    result = client.get_currency_rates(currency)
 
     # assert
-    assert len(result.rates) == 183
+    assert len(result.rates) == expected_count
 
 
-@pytest.mark.unit
-def test_get_currency_pair_rate(mocker):
+def test_get_currency_pair_rate(bitpay_client, client):
     # arrange
-    bitpay_client = get_bitpay_client(mocker)
     response = {"code": "USD", "name": "US Dollar", "rate": 119.11}
     bitpay_client.get.side_effect = mock_response(
         response, "rates/BCH/USD", None, False
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.get_currency_pair_rate("BCH", "USD")
@@ -1110,24 +793,16 @@ def test_get_currency_pair_rate(mocker):
     assert result.code == "USD"
 
 
-@pytest.mark.unit
-def get_ledger_entries(mocker):
+def get_ledger_entries(bitpay_client, client):
     # arrange
     currency = "USD"
     dateStart = "2021-5-10"
     dateEnd = "2021-5-31"
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/get_ledger_entries_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_ledger_entries_response.json")
     params = {"token": merchant_token_value, "starDate": dateStart, "endDate": dateEnd}
     bitpay_client.post.side_effect = mock_response(
         response, "ledgers/" + currency, params, True
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.get_ledger_entries(currency, dateStart, dateEnd)
@@ -1139,17 +814,11 @@ def get_ledger_entries(mocker):
     assert result[2].buyer_fields.address1 == "2630 Hegal Place"
 
 
-@pytest.mark.unit
-def test_get_ledgers(mocker):
+def test_get_ledgers(bitpay_client, client):
     # arrange
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/get_ledgers.json", "r"
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_ledgers.json")
     params = {"token": merchant_token_value}
     bitpay_client.get.side_effect = mock_response(response, "ledgers", params, True)
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.get_ledgers()
@@ -1160,29 +829,16 @@ def test_get_ledgers(mocker):
     assert result[1].balance == 2389.82
 
 
-@pytest.mark.unit
-def test_submit_payout_recipients(mocker):
+def test_submit_payout_recipients(bitpay_client, client, example_payout_recipients):
     # arrange
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/submit_payout_recipients_request.json",
-        "r",
-    ) as file:
-        request = json.load(file)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/submit_payout_recipients_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    request = load_fixture("submit_payout_recipients_request.json")
+    response = load_fixture("submit_payout_recipients_response.json")
     bitpay_client.post.side_effect = mock_response(
         response, "recipients", request, True
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
-    result = client.submit_payout_recipients(get_example_payout_recipients())
+    result = client.submit_payout_recipients(example_payout_recipients)
 
     # assert
     assert len(result) == 2
@@ -1194,17 +850,10 @@ def test_submit_payout_recipients(mocker):
     assert result[1].id == "X3icwc4tE8KJ5hEPNPpDXW"
 
 
-@pytest.mark.unit
-def test_get_payout_recipients(mocker):
+def test_get_payout_recipients(bitpay_client, client):
     # arrange
     status = "invited"
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/get_payout_recipients_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_payout_recipients_response.json")
     params = {
         "token": payout_token_value,
         "status": status,
@@ -1212,7 +861,6 @@ def test_get_payout_recipients(mocker):
         "offset": "0",
     }
     bitpay_client.get.side_effect = mock_response(response, "recipients", params, True)
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.get_payout_recipients(status)
@@ -1229,22 +877,14 @@ def test_get_payout_recipients(mocker):
     )
 
 
-@pytest.mark.unit
-def test_get_payout_recipient(mocker):
+def test_get_payout_recipient(bitpay_client, client):
     # arrange
     recipient_id = "JA4cEtmBxCp5cybtnh1rds"
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/get_payout_recipient_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_payout_recipient_response.json")
     params = {"token": payout_token_value}
     bitpay_client.get.side_effect = mock_response(
         response, "recipients/" + recipient_id, params, True
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.get_payout_recipient(recipient_id)
@@ -1259,29 +899,16 @@ def test_get_payout_recipient(mocker):
     )
 
 
-@pytest.mark.unit
-def test_update_payout_recipient(mocker):
+def test_update_payout_recipient(bitpay_client, client):
     # arrange
     recipient_id = "JA4cEtmBxCp5cybtnh1rds"
     label = "Bob123"
     update_payout_recipient_data = PayoutRecipient(label=label, token=label)
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/update_payout_recipient_request.json",
-        "r",
-    ) as file:
-        request = json.load(file)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/update_payout_recipient_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    request = load_fixture("update_payout_recipient_request.json")
+    response = load_fixture("update_payout_recipient_response.json")
     bitpay_client.update.side_effect = mock_response(
         response, "recipients/" + recipient_id, request, True
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.update_payout_recipient(recipient_id, update_payout_recipient_data)
@@ -1291,64 +918,14 @@ def test_update_payout_recipient(mocker):
     assert result.email == "bob@email.com"
 
 
-@pytest.mark.unit
-def test_delete_payout_recipient(mocker):
+def test_submit_payout(bitpay_client, client, example_payout):
     # arrange
-    recipient_id = "JA4cEtmBxCp5cybtnh1rds"
-    bitpay_client = get_bitpay_client(mocker)
-    response = {"status": "Success"}
-    params = {"token": payout_token_value}
-    bitpay_client.delete.side_effect = mock_response(
-        response, "recipients/" + recipient_id, params, True
-    )
-    client = init_client(mocker, bitpay_client)
-
-    # act
-    result = client.delete_payout_recipient(recipient_id)
-
-    # assert
-    assert result is True
-
-
-@pytest.mark.unit
-def test_request_payout_recipient_notification(mocker):
-    # arrange
-    recipient_id = "JA4cEtmBxCp5cybtnh1rds"
-    bitpay_client = get_bitpay_client(mocker)
-    response = {"status": "Success"}
-    params = {"token": payout_token_value}
-    url = "recipients/" + recipient_id + "/notifications"
-    bitpay_client.post.side_effect = mock_response(response, url, params, True)
-    client = init_client(mocker, bitpay_client)
-
-    # act
-    result = client.request_payout_recipient_notification(recipient_id)
-
-    # assert
-    assert result is True
-
-
-@pytest.mark.unit
-def test_submit_payout(mocker):
-    # arrange
-    payout = get_example_payout()
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/submit_payout_request.json",
-        "r",
-    ) as file:
-        request = json.load(file)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/submit_payout_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    request = load_fixture("submit_payout_request.json")
+    response = load_fixture("submit_payout_response.json")
     bitpay_client.post.side_effect = mock_response(response, "payouts", request, True)
-    client = init_client(mocker, bitpay_client)
 
     # act
-    result = client.submit_payout(payout)
+    result = client.submit_payout(example_payout)
 
     # assert
     assert (
@@ -1364,21 +941,14 @@ def test_submit_payout(mocker):
     assert result.id == "JMwv8wQCXANoU2ZZQ9a9GH"
 
 
-@pytest.mark.unit
-def test_get_payout(mocker):
+def test_get_payout(bitpay_client, client):
     # arrange
     payout_id = "JMwv8wQCXANoU2ZZQ9a9GH"
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/get_payout_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_payout_response.json")
     params = {"token": payout_token_value}
     bitpay_client.get.side_effect = mock_response(
         response, "payouts/" + payout_id, params, True
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.get_payout(payout_id)
@@ -1396,40 +966,13 @@ def test_get_payout(mocker):
     )
 
 
-@pytest.mark.unit
-def test_cancel_payout(mocker):
-    # arrange
-    payout_id = "1234"
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/success_response.json", "r"
-    ) as file:
-        response = json.load(file)
-    params = {"token": payout_token_value}
-    bitpay_client.delete.side_effect = mock_response(
-        response, "payouts/" + payout_id, params, True
-    )
-    client = init_client(mocker, bitpay_client)
-
-    # act
-    result = client.cancel_payout(payout_id)
-
-    # assert
-    assert result is True
-
-
-@pytest.mark.unit
-def test_get_payouts(mocker):
+def test_get_payouts(bitpay_client, client):
     # arrange
     startDate = "2021-05-27"
     endDate = "2021-05-31"
     limit = 10
     offset = 1
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/get_payouts.json", "r"
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_payouts.json")
     params = {
         "token": payout_token_value,
         "startDate": startDate,
@@ -1438,7 +981,6 @@ def test_get_payouts(mocker):
         "offset": offset,
     }
     bitpay_client.get.side_effect = mock_response(response, "payouts", params, True)
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.get_payouts(startDate, endDate, None, None, limit, offset)
@@ -1457,22 +999,10 @@ def test_get_payouts(mocker):
     )
 
 
-@pytest.mark.unit
-def test_create_payout_group(mocker):
+def test_create_payout_group(bitpay_client, client):
     # arrange
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/create_payout_group_request.json",
-        "r",
-    ) as file:
-        request_dict = json.load(file)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/create_payout_group_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    request_dict = load_fixture("create_payout_group_request.json")
+    response = load_fixture("create_payout_group_response.json")
     shopper_id = "7qohDf2zZnQK5Qanj8oyC2"
     payout = Payout(
         amount=10,
@@ -1490,7 +1020,6 @@ def test_create_payout_group(mocker):
     bitpay_client.post.side_effect = mock_response(
         response, "payouts/group", request_dict, True
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.create_payout_group([payout])
@@ -1500,23 +1029,15 @@ def test_create_payout_group(mocker):
     assert result.failed[0].err_message == "Ledger currency is required"
 
 
-@pytest.mark.unit
-def test_cancel_payout_group(mocker):
+def test_cancel_payout_group(bitpay_client, client):
     # arrange
     group_id = "12345"
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/cancel_payout_group_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("cancel_payout_group_response.json")
 
     params = {"token": payout_token_value}
     bitpay_client.delete.side_effect = mock_response(
         response, "payouts/group/" + group_id, params, True
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.cancel_payout_group(group_id)
@@ -1527,30 +1048,7 @@ def test_cancel_payout_group(mocker):
     assert result.failed[0].payout_id == "D8tgWzn1psUua4NYWW1vYo"
 
 
-@pytest.mark.unit
-def test_request_payout_notification(mocker):
-    # arrange
-    payout_id = "1234"
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__)) + "/json/success_response.json", "r"
-    ) as file:
-        response = json.load(file)
-    params = {"token": payout_token_value}
-    bitpay_client.post.side_effect = mock_response(
-        response, "payouts/" + payout_id + "/notifications", params, True
-    )
-    client = init_client(mocker, bitpay_client)
-
-    # act
-    result = client.request_payout_notification(payout_id)
-
-    # assert
-    assert result is True
-
-
-@pytest.mark.unit
-def test_get_settlements(mocker):
+def test_get_settlements(bitpay_client, client):
     # arrange
     currency = "USD"
     dateStart = "2021-05-10"
@@ -1558,13 +1056,7 @@ def test_get_settlements(mocker):
     status = "processing"
     limit = 10
     offset = 0
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/get_settlements_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_settlements_response.json")
     params = {
         "token": merchant_token_value,
         "limit": limit,
@@ -1575,7 +1067,6 @@ def test_get_settlements(mocker):
         "status": status,
     }
     bitpay_client.get.side_effect = mock_response(response, "settlements", params, True)
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.get_settlements(currency, dateStart, dateEnd, status, limit, offset)
@@ -1588,22 +1079,14 @@ def test_get_settlements(mocker):
     assert result[0].total_amount == 22.09
 
 
-@pytest.mark.unit
-def test_get_settlement(mocker):
+def test_get_settlement(bitpay_client, client):
     # arrange
     settlement_id = "DNFnN3fFjjzLn6if5bdGJC"
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/get_settlement_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_settlement_response.json")
     params = {"token": merchant_token_value}
     bitpay_client.get.side_effect = mock_response(
         response, "settlements/" + settlement_id, params, True
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.get_settlement(settlement_id)
@@ -1615,25 +1098,17 @@ def test_get_settlement(mocker):
     assert result.withholdings[0].description == "Pending Refunds"
 
 
-@pytest.mark.unit
-def test_get_settlement_reconciliation_report(mocker):
+def test_get_settlement_reconciliation_report(bitpay_client, client):
     # arrange
     settlement_id = "DNFnN3fFjjzLn6if5bdGJC"
     settlement_token = (
         "5T1T5yGDEtFDYe8jEVBSYLHKewPYXZrDLvZxtXBzn69fBbZYitYQYH4BFYFvvaVU7D"
     )
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/get_settlement_reconciliation_report_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_settlement_reconciliation_report_response.json")
     params = {"token": settlement_token}
     bitpay_client.get.side_effect = mock_response(
         response, "settlements/" + settlement_id + "/reconciliationReport", params, True
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.get_settlement_reconciliation_report(
@@ -1648,20 +1123,12 @@ def test_get_settlement_reconciliation_report(mocker):
     assert result.ledger_entries[0].amount == 5.83
 
 
-@pytest.mark.unit
-def test_get_supported_wallets(mocker):
+def test_get_supported_wallets(bitpay_client, client):
     # arrange
-    bitpay_client = get_bitpay_client(mocker)
-    with open(
-        os.path.abspath(os.path.dirname(__file__))
-        + "/json/get_supported_wallets_response.json",
-        "r",
-    ) as file:
-        response = json.load(file)
+    response = load_fixture("get_supported_wallets_response.json")
     bitpay_client.get.side_effect = mock_response(
         response, "supportedWallets/", None, False
     )
-    client = init_client(mocker, bitpay_client)
 
     # act
     result = client.get_supported_wallets()
@@ -1675,3 +1142,82 @@ def test_get_supported_wallets(mocker):
         result[0].currencies[0].image
         == "https://bitpay.com/img/icon/currencies/BTC.svg"
     )
+
+
+BOOLEAN_CASES = [
+    pytest.param(
+        "post",
+        "invoices/" + invoice_id + "/notifications",
+        {"token": merchant_token_value},
+        "success",
+        lambda client: client.request_invoice_notifications(invoice_id),
+        id="request_invoice_notifications",
+    ),
+    pytest.param(
+        "post",
+        "refunds/1234/notifications",
+        {"token": merchant_token_value},
+        {"status": "success"},
+        lambda client: client.request_refund_notification("1234"),
+        id="request_refund_notification",
+    ),
+    pytest.param(
+        "post",
+        "bills/12345/deliveries",
+        {"token": "someBillToken"},
+        "Success",
+        lambda client: client.deliver_bill("12345", "someBillToken"),
+        id="deliver_bill",
+    ),
+    pytest.param(
+        "delete",
+        "recipients/JA4cEtmBxCp5cybtnh1rds",
+        {"token": payout_token_value},
+        {"status": "Success"},
+        lambda client: client.delete_payout_recipient("JA4cEtmBxCp5cybtnh1rds"),
+        id="delete_payout_recipient",
+    ),
+    pytest.param(
+        "post",
+        "recipients/JA4cEtmBxCp5cybtnh1rds/notifications",
+        {"token": payout_token_value},
+        {"status": "Success"},
+        lambda client: client.request_payout_recipient_notification(
+            "JA4cEtmBxCp5cybtnh1rds"
+        ),
+        id="request_payout_recipient_notification",
+    ),
+    pytest.param(
+        "delete",
+        "payouts/1234",
+        {"token": payout_token_value},
+        load_fixture("success_response.json"),
+        lambda client: client.cancel_payout("1234"),
+        id="cancel_payout",
+    ),
+    pytest.param(
+        "post",
+        "payouts/1234/notifications",
+        {"token": payout_token_value},
+        load_fixture("success_response.json"),
+        lambda client: client.request_payout_notification("1234"),
+        id="request_payout_notification",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "verb,url,params,response,call",
+    BOOLEAN_CASES,
+)
+def test_boolean_endpoint(bitpay_client, client, verb, url, params, response, call):
+    # arrange
+    getattr(bitpay_client, verb).side_effect = mock_response(
+        response, url, params, True
+    )
+
+    # act
+    result = call(client)
+
+    # assert
+    assert result is True